@@ -11,11 +11,10 @@ import datetime
 import json
 import logging
 import torch
-from torch.optim import Adam
 from qulearn.datagen import DataGenFat, UniformPrior
 from qulearn.trainer import SupervisedTrainer
 from qulearn.fat import fat_shattering_dim
-from model_builder import ModelBuilder, CDEV, QDEV
+from model_builder import ModelBuilder, CDEV, QDEV, make_adam
 
 CONFIGS_PATH = "../../model_configs.json"
 
@@ -115,7 +114,7 @@ def main(args):
     for config in configs:
         model_id = config["id"]
         model = model_builder.create_model(model_id)
-        optimizer = Adam(model.parameters(), lr=args.lr, amsgrad=args.amsgrad)
+        optimizer = make_adam(model.parameters(), lr=args.lr, amsgrad=args.amsgrad)
         loss_fn = torch.nn.MSELoss()
         logger = logging.getLogger("fat")
         logger.setLevel(level=logging.INFO)
@@ -11,11 +11,10 @@ import datetime
 import json
 import logging
 import torch
-from torch.optim import Adam
 from qulearn.datagen import DataGenCapacity
 from qulearn.trainer import SupervisedTrainer, RidgeRegression
 from qulearn.memory import memory
-from model_builder import ModelBuilder, CDEV, QDEV
+from model_builder import ModelBuilder, CDEV, QDEV, make_adam
 
 CONFIGS_PATH = "../../model_configs.json"
 
@@ -137,7 +136,7 @@ def main(args):
             continue
 
         model = model_builder.create_model(model_id)
-        optimizer = Adam(model.parameters(), lr=args.lr, amsgrad=args.amsgrad)
+        optimizer = make_adam(model.parameters(), lr=args.lr, amsgrad=args.amsgrad)
         loss_fn = torch.nn.MSELoss()
         metrics = {"mse_loss": loss_fn}
         logger.info(f"=============== Model ID: {model_id} | START ===============")
@@ -15,12 +15,13 @@ import os
 
 os.environ["OMP_NUM_THREADS"] = "8"
 
-from typing import List, Optional, Dict, Callable
+from typing import List, Optional, Dict, Callable, Iterable
 import json
 from enum import Enum
 from itertools import combinations
 import torch
 from torch import nn
+from torch.optim import Adam
 import pennylane as qml
 from qulearn.qlayer import (
     CircuitLayer,
@@ -106,6 +107,12 @@ def observable_list(num_wires: int, type: HamiltonianType) -> List[Observable]:
     return observable_opts[type](num_wires)
 
 
+def make_adam(params: Iterable[Tensor], lr: float, amsgrad: bool) -> Adam:
+    # multi-tensor Adam on CPU, fused kernel on CUDA
+    fused = CDEV.type == "cuda"
+    return Adam(params, lr=lr, amsgrad=amsgrad, foreach=not fused, fused=fused)
+
+
 class QNNModel(nn.Module):
     def __init__(self, **config) -> None:
         super().__init__()
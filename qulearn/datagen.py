@@ -270,7 +270,12 @@ class DataGenFat(DataGenTorch[DataOut, Loader]):
         r = generate_samples_r_fat(d=d, S=self.Sr, seed=self.seed)
         Y = gen_synthetic_labels_fat(b, r, self.gamma, self.device)
 
-        data = {"X": X, "Y": Y, "b": b, "r": r}
+        data = {
+            "X": X,
+            "Y": Y,
+            "b": torch.tensor(b, dtype=torch.bool, device=self.device),
+            "r": torch.tensor(r, dtype=torch.float64, device=self.device),
+        }
 
         return data
 
@@ -771,9 +776,7 @@ def gen_synthetic_labels_fat(
     :raises ValueError: If the length of b[0] is not the same as the length of r[0].
     """
 
-    Sb = len(b)
-    Sr = len(r)
-    d = d1 = len(b[0])
+    d1 = len(b[0])
     d2 = len(r[0])
 
     if d1 != d2:
@@ -782,14 +785,10 @@ def gen_synthetic_labels_fat(
             f"Should be constant and the same."
         )
 
-    labels = np.zeros((Sr, Sb, d, 1))
-    for sr in range(Sr):
-        for sb in range(Sb):
-            for i in range(d):
-                if b[sb][i] == 1:
-                    labels[sr, sb, i, 0] = r[sr, i] + gamma
-                else:
-                    labels[sr, sb, i, 0] = r[sr, i] - gamma
+    # broadcast (1, Sb, d) against (Sr, 1, d)
+    b_ = np.asarray(b)[np.newaxis, :, :]
+    r_ = np.asarray(r)[:, np.newaxis, :]
+    labels = np.where(b_ == 1, r_ + gamma, r_ - gamma)[..., np.newaxis]
 
     y = torch.tensor(labels, dtype=torch.float64, device=device, requires_grad=False)
 
@@ -1,9 +1,15 @@
+from typing import Deque, Iterator, Optional, Sequence
+
 # for python < 3.10
 try:
     from typing import TypeAlias
 except ImportError:
     from typing_extensions import TypeAlias
 
+from collections import deque
+from contextlib import closing
+from functools import partial
+from multiprocessing.pool import AsyncResult
 import logging
 import torch
 import pennylane as qml
@@ -25,6 +31,7 @@ def fat_shattering_dim(
     dmax: int,
     gamma: float = 0.0,
     dstep: int = 1,
+    max_workers: Optional[int] = None,
 ) -> int:
     """
     Estimate the fat-shattering dimension for a model with a given architecture.
@@ -43,26 +50,76 @@ def fat_shattering_dim(
     :type gamma: float, optional
     :param dstep: Dimension iteration step size. Defaults to 1.
     :type dstep: int
+    :param max_workers: If set, check up to max_workers dimensions in parallel
+        (spawned) processes. Each process trains its own copy of the model, hence
+        model, datagen and trainer must be picklable. Checks still running for
+        higher dimensions are terminated once the result is known.
+        Defaults to None (sequential).
+    :type max_workers: int, optional
     :return: The estimated fat-shattering dimension.
     :rtype: int
     """
 
-    for d in range(dmin, dmax + 1, dstep):
-        shattered = check_shattering(model, datagen, trainer, d, gamma)
-
-        if not shattered:
-            if d == dmin:
-                logging.basicConfig(level=logging.WARNING)
-                logging.warning(f"Stopped at dmin = {dmin}.")
-                return dmin
+    dims = range(dmin, dmax + 1, dstep)
+    results = _check_shattering_dims(model, datagen, trainer, dims, gamma, max_workers)
+    # closing stops (and terminates) pending checks on early return
+    with closing(results):
+        for d, shattered in zip(dims, results):
+            if not shattered:
+                if d == dmin:
+                    logging.basicConfig(level=logging.WARNING)
+                    logging.warning(f"Stopped at dmin = {dmin}.")
+                    return dmin
 
-            return d - dstep
+                return d - dstep
 
     logging.basicConfig(level=logging.WARNING)
     logging.warning(f"Reached dmax = {dmax}.")
     return dmax
 
 
+def _check_shattering_dims(
+    model: Model,
+    datagen: Datagen,
+    trainer: Trainer,
+    dims: Sequence[int],
+    gamma: float,
+    max_workers: Optional[int] = None,
+) -> Iterator[bool]:
+    # yields check_shattering for each d in order, possibly in parallel processes
+    if max_workers is None:
+        for d in dims:
+            yield check_shattering(model, datagen, trainer, d, gamma)
+        return
+
+    # spawn: fork is unsafe with CUDA / lightning.gpu and torch thread pools
+    pool = torch.multiprocessing.get_context("spawn").Pool(processes=max_workers)
+    dims_left = iter(dims)
+    results: Deque[AsyncResult] = deque()
+
+    def submit_next() -> None:
+        d = next(dims_left, None)
+        if d is not None:
+            results.append(
+                pool.apply_async(check_shattering, (model, datagen, trainer, d, gamma))
+            )
+
+    # rolling window: keep max_workers checks running, submit the next
+    # dimension only once the smallest running one is consumed
+    try:
+        for _ in range(max_workers):
+            submit_next()
+
+        while results:
+            shattered = results.popleft().get()
+            yield shattered
+            submit_next()
+    finally:
+        # kill checks of higher dimensions still running once consumption stops
+        pool.terminate()
+        pool.join()
+
+
 def check_shattering(
     model: Model, datagen: Datagen, trainer: Trainer, d: int, gamma: float
 ) -> bool:
@@ -92,16 +149,9 @@ def check_shattering(
         shattered = True
         for sb in range(len(b)):
             loader = datagen.data_to_loader(data, sr, sb)
-            trainer.train(model, loader, loader)
-            predictions = model(X)
-
-            for i, pred in enumerate(predictions):
-                if b[sb, i] == 1 and not (pred >= r[sr, i] + gamma):
-                    shattered = False
-                    break
-                if b[sb, i] == 0 and not (pred <= r[sr, i] - gamma):
-                    shattered = False
-                    break
+            stop_fn = partial(check_margins, X=X, b=b[sb], r=r[sr], gamma=gamma)
+            trainer.train(model, loader, loader, stop_fn=stop_fn)
+            shattered = stop_fn(model)
 
             if not shattered:
                 break
@@ -112,6 +162,34 @@ def check_shattering(
     return False
 
 
+def check_margins(model: Model, X: Tensor, b: Tensor, r: Tensor, gamma: float) -> bool:
+    """
+    Check if the model predictions on X lie above r + gamma where b is set
+    and below r - gamma otherwise.
+
+    :param model: The model.
+    :type model: Model
+    :param X: Input data of shape (d, sizex).
+    :type X: Tensor
+    :param b: Binary labels of shape (d,).
+    :type b: Tensor
+    :param r: Level offsets of shape (d,).
+    :type r: Tensor
+    :param gamma: The margin value.
+    :type gamma: float
+    :return: True if all predictions satisfy the margin condition, False otherwise.
+    :rtype: bool
+    """
+
+    with torch.no_grad():
+        predictions = model(X).reshape(-1)
+
+    above = predictions >= r + gamma
+    below = predictions <= r - gamma
+
+    return bool(torch.where(b.bool(), above, below).all())
+
+
 def normalize_const(weights: Tensor, gamma: float, Rx: float) -> float:
     """
     Compute a normalization constant given a tensor of weights and
@@ -133,8 +211,7 @@ def normalize_const(weights: Tensor, gamma: float, Rx: float) -> float:
     :rtype: float
     """
 
-    V = torch.norm(weights, p=2)
-    V = V.item()
-    C = V**2 * Rx**2 / gamma**2
+    V2 = weights.detach().square().sum().item()
+    C = V2 * Rx**2 / gamma**2
 
     return C
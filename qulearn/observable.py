@@ -1,4 +1,4 @@
-from typing import List, Tuple, Sequence
+from typing import List, Tuple, Sequence, Optional
 
 # for python < 3.10
 try:
@@ -6,6 +6,7 @@ try:
 except ImportError:
     from typing_extensions import TypeAlias
 
+from functools import lru_cache
 import math
 import torch
 import pennylane as qml
@@ -48,6 +49,63 @@ def parity_all_hamiltonian(num_qubits: int, weights: Tensor) -> Hamiltonian:
     return H
 
 
+def parity_all_lowrank_index(num_qubits: int) -> Tensor:
+    """
+    Index mapping the flattened low-rank weight matrix U^T V of
+    :func:`parity_all_lowrank_weights` to the order of
+    :func:`parities_all_observables`.
+
+    :param num_qubits: Number of qubits.
+    :type num_qubits: int
+    :return: Index tensor of shape (2^num_qubits,).
+    :rtype: Tensor
+    """
+
+    return torch.tensor(_parities_all_bitmasks(num_qubits), dtype=torch.long)
+
+
+def parity_all_lowrank_weights(
+    num_qubits: int, U: Tensor, V: Tensor, index: Optional[Tensor] = None
+) -> Tensor:
+    """
+    Weights for :func:`parity_all_hamiltonian` given by a low-rank factorization.
+    The weight of the parity of the qubit subset S1 of the first num_qubits//2 qubits
+    and S2 of the remaining qubits is sum_k U[k, S1]*V[k, S2], where subsets are
+    indexed by their bitmask.
+
+    :param num_qubits: Number of qubits.
+    :type num_qubits: int
+    :param U: Factor of shape (rank, 2^(num_qubits//2)).
+    :type U: Tensor
+    :param V: Factor of shape (rank, 2^(num_qubits - num_qubits//2)).
+    :type V: Tensor
+    :param index: Precomputed :func:`parity_all_lowrank_index`, on the device
+        of U and V. Computed on each call if None, defaults to None.
+    :type index: Optional[Tensor]
+    :return: Weights of shape (2^num_qubits,), ordered as
+        :func:`parities_all_observables`.
+    :rtype: Tensor
+    :raises ValueError: If shapes of U or V are not as specified above.
+    """
+
+    n1 = num_qubits // 2
+    n2 = num_qubits - n1
+    shapeU = U.shape
+    shapeV = V.shape
+    if len(shapeU) != 2 or shapeU[1] != 2**n1:
+        raise ValueError(f"U (shape={shapeU}) must be of shape (rank, {2**n1})")
+    if len(shapeV) != 2 or shapeV[1] != 2**n2:
+        raise ValueError(f"V (shape={shapeV}) must be of shape (rank, {2**n2})")
+    if shapeU[0] != shapeV[0]:
+        raise ValueError(f"Ranks of U (shape={shapeU}) and V (shape={shapeV}) differ")
+
+    W = torch.matmul(U.T, V).flatten()
+    if index is None:
+        index = parity_all_lowrank_index(num_qubits).to(W.device)
+
+    return W[index]
+
+
 def parities_all_observables(n: int) -> List[Observable]:
     """
     Generates a list of observables corresponding to the parity of all
@@ -60,8 +118,14 @@ def parities_all_observables(n: int) -> List[Observable]:
     :rtype: List[Observable]
     """
 
+    return list(_parities_all_observables(n))
+
+
+@lru_cache(maxsize=None)
+def _parities_all_observables(n: int) -> Tuple[Observable, ...]:
+    # observables only depend on n, build the 2^n terms once
     seq = all_bin_sequences(n)
-    return sequence2parity_observable(seq)
+    return tuple(sequence2parity_observable(seq))
 
 
 def sequence2parity_observable(parity_sequence: ParitySequence) -> List[Observable]:
@@ -78,14 +142,29 @@ def sequence2parity_observable(parity_sequence: ParitySequence) -> List[Observab
 
     ops = []
     for par in parity_sequence:
-        if par:
-            tmp = qml.PauliZ(par[0])
-            if len(par) > 1:
-                for i in par[1:]:
-                    tmp = tmp @ qml.PauliZ(i)
-
-            ops.append(tmp)
+        if len(par) == 1:
+            ops.append(qml.PauliZ(par[0]))
+        elif par:
+            # single tensor product instead of chaining @ (copies on each step)
+            ops.append(qml.operation.Tensor(*[qml.PauliZ(i) for i in par]))
 
     ops.append(qml.Identity(0))
 
     return ops
+
+
+@lru_cache(maxsize=None)
+def _parities_all_bitmasks(n: int) -> Tuple[int, ...]:
+    # index into the flattened (2^(n//2), 2^(n - n//2)) weight matrix
+    # for each observable of parities_all_observables
+    n1 = n // 2
+    masks = []
+    for par in all_bin_sequences(n):
+        if par:
+            mask1 = sum(1 << i for i in par if i < n1)
+            mask2 = sum(1 << (i - n1) for i in par if i >= n1)
+            masks.append(mask1 * 2 ** (n - n1) + mask2)
+
+    masks.append(0)
+
+    return tuple(masks)
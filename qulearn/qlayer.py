@@ -14,6 +14,11 @@ import pennylane as qml
 
 from .hat_basis import HatBasis
 from .mps import HatBasisMPS, MPSQGates
+from .observable import (
+    parities_all_observables,
+    parity_all_lowrank_index,
+    parity_all_lowrank_weights,
+)
 
 DEFAULT_QDEV_CFG = {"name": "default.qubit", "shots": None}
 
@@ -933,7 +938,14 @@ class MeasurementLayer(nn.Module):
     :param observables: Observables to measure.
         None only works with Probabilities and Samples.
     :type observables: Optional[Observables], defaults to None
+    :param batched: Evaluate 2-dim inputs with a single (broadcasted) QNode call
+        instead of one call per sample. Requires all circuit layers to support
+        parameter broadcasting (e.g., IQP embeddings with variational layers).
+        Falls back to one call per sample if the measurement does not support
+        broadcasting, see :meth:`supports_broadcasting`.
+    :type batched: bool, defaults to False
     :param kwargs: Additional keyword arguments for qml.QNode.
+        If no diff_method is given, :meth:`default_diff_method` is used.
     """
 
     def __init__(
@@ -942,6 +954,7 @@ class MeasurementLayer(nn.Module):
         qdevice: Optional[QDevice] = None,
         measurement_type: MeasurementType = MeasurementType.Probabilities,
         observables: Optional[Observables] = None,
+        batched: bool = False,
         **kwargs,
     ) -> None:
         super().__init__()
@@ -954,13 +967,16 @@ class MeasurementLayer(nn.Module):
 
         self.wires = self.circuits[0].wires
         self.measurement_type = measurement_type
+        self.batched = batched
 
         self.observables = observables
         if observables is not None and not isinstance(observables, Iterable):
             self.observables = [observables]
 
         self.interface = kwargs.pop("interface", "torch")
-        self.diff_method = kwargs.pop("diff_method", "backprop")
+        self.diff_method = kwargs.pop("diff_method", None)
+        if self.diff_method is None:
+            self.diff_method = self.default_diff_method()
         self.kwargs = kwargs
         self.check_measurement_type()
         self.qnode = self.set_qnode()
@@ -977,11 +993,20 @@ class MeasurementLayer(nn.Module):
         :return: Forward evaluation of model on data.
         :rtype: Tensor
         """
-        self.qnode = self.set_qnode()
-
         if x is not None:
             if len(x.shape) == 1:
                 out = self.qnode(x)
+            elif self.batched and self.supports_broadcasting():
+                out = self.qnode(x)
+                if isinstance(out, (tuple, list)):
+                    out = torch.stack(list(out), dim=-1)
+                elif (
+                    self.measurement_type == MeasurementType.Expectation
+                    and len(self.observables) > 1
+                    and not _active_return()
+                ):
+                    # old return system stacks expectations as (num_obs, batch)
+                    out = out.T
             else:
                 outs = [self.qnode(xk) for xk in torch.unbind(x)]
                 out = torch.stack(outs)
@@ -996,6 +1021,25 @@ class MeasurementLayer(nn.Module):
 
         return out
 
+    def supports_broadcasting(self) -> bool:
+        """
+        Check if the measurement can be evaluated with parameter broadcasting.
+        Expectations of Hamiltonians are not supported by PennyLane with
+        broadcasting, unless grouping indices are set and the device splits
+        the Hamiltonian into its terms.
+
+        :return: True if batched inputs can be passed to the QNode at once.
+        :rtype: bool
+        """
+
+        if self.measurement_type != MeasurementType.Expectation:
+            return True
+
+        return all(
+            not isinstance(obs, qml.Hamiltonian) or obs.grouping_indices is not None
+            for obs in self.observables
+        )
+
     def expectation(self, x: Optional[Tensor] = None) -> Expectation:
         """
         Calculate the expectation value of the observable for given circuits.
@@ -1059,6 +1103,8 @@ class MeasurementLayer(nn.Module):
     def set_qnode(self) -> QNode:
         """
         Set the quantum node for the layer and measurement type.
+        Needs to be called again after changing the quantum device,
+        measurement type or QNode options.
 
         :return: The set QNode.
         :rtype: QNode
@@ -1083,6 +1129,25 @@ class MeasurementLayer(nn.Module):
         self.qnode = qnode
         return self.qnode
 
+    def default_diff_method(self) -> str:
+        """
+        Default differentiation method for the quantum device and measurement type.
+        Lightning devices do not support backpropagation, for these adjoint
+        differentiation is used for expectations and parameter-shift otherwise.
+
+        :return: The differentiation method.
+        :rtype: str
+        """
+
+        name = getattr(self.qdevice, "short_name", self.qdevice.name)
+        if not name.startswith("lightning"):
+            return "backprop"
+
+        if self.measurement_type == MeasurementType.Expectation:
+            return "adjoint"
+
+        return "parameter-shift"
+
     def check_measurement_type(self) -> None:
         """
         Check if the measurement type is valid.
@@ -1114,7 +1179,109 @@ class MeasurementLayer(nn.Module):
             )
 
 
-class HamiltonianLayer(MeasurementLayer):
+class WeightedHamiltonianLayer(MeasurementLayer):
+    """
+    Base class for layers that compute the expectation of a Hamiltonian
+    defined by a list of observables and their associated weights.
+
+    Derived classes need to provide the (trainable) :attr:`observable_weights`.
+
+    :param circuits: Quantum circuits that make up the circuit layer before measurement.
+    :type circuits: tuple
+    :param observables: Observables defining the Hamiltonian.
+    :type observables: list of Observable
+    :param qdevice: Quantum device. If None specified, the default device is used.
+    :type qdevice: Optional[QDevice]
+    :param grouping_type: Grouping of the observables into commuting groups
+        (e.g., "qwc"), computed once on construction. Reduces the number of
+        circuit executions for finite shots. Defaults to None (no grouping).
+    :type grouping_type: str, optional
+    :param kwargs: Additional keyword arguments passed to the superclass.
+    """
+
+    def __init__(
+        self,
+        *circuits,
+        observables: Iterable[Observable],
+        qdevice: Optional[QDevice] = None,
+        grouping_type: Optional[str] = None,
+        **kwargs,
+    ) -> None:
+        observables = list(observables)
+        super().__init__(
+            *circuits,
+            qdevice=qdevice,
+            measurement_type=MeasurementType.Expectation,
+            observables=observables,
+            **kwargs,
+        )
+        self.grouping_type = grouping_type
+
+        # grouping does not depend on the weights, reuse it on every call
+        self.grouping_indices = None
+        if self.grouping_type is not None:
+            H = qml.Hamiltonian(
+                [1.0] * len(observables), observables, grouping_type=grouping_type
+            )
+            self.grouping_indices = H.grouping_indices
+
+    def supports_broadcasting(self) -> bool:
+        """
+        Check if the measurement can be evaluated with parameter broadcasting,
+        see :meth:`MeasurementLayer.supports_broadcasting`.
+
+        :return: True if grouping indices are set.
+        :rtype: bool
+        """
+
+        return self.grouping_indices is not None
+
+    def hamiltonian(self) -> qml.Hamiltonian:
+        """
+        Hamiltonian for the current observable weights.
+
+        :return: The Hamiltonian.
+        :rtype: qml.Hamiltonian
+        """
+        H = qml.Hamiltonian(self.observable_weights, self.observables)
+        if self.grouping_indices is not None:
+            H.grouping_indices = self.grouping_indices
+
+        return H
+
+    def default_diff_method(self) -> str:
+        """
+        Default differentiation method as in :meth:`MeasurementLayer`, except that
+        parameter-shift replaces adjoint differentiation, since the latter
+        does not compute gradients of the observable weights.
+
+        :return: The differentiation method.
+        :rtype: str
+        """
+
+        diff_method = super().default_diff_method()
+        if diff_method == "adjoint":
+            diff_method = "parameter-shift"
+
+        return diff_method
+
+    def expectation(self, x: Optional[Tensor] = None) -> Expectation:
+        """
+        Compute the expectation of the Hamiltonian.
+
+        :param x: Input tensor, defaults to None.
+        :type x: Optional[Tensor]
+        :return: Expectation value of the Hamiltonian.
+        :rtype: Expectation
+        """
+        for circuit in self.circuits:
+            circuit(x)
+        self.observable = self.hamiltonian()
+        expec = qml.expval(self.observable)
+        return expec
+
+
+class HamiltonianLayer(WeightedHamiltonianLayer):
     """
     A layer that computes the expectation of a Hamiltonian.
 
@@ -1132,7 +1299,8 @@ class HamiltonianLayer(MeasurementLayer):
     :type cdevice: CDevice, optional
     :param dtype: Data type of the observable weights.
     :type dtype: DType, optional
-    :param kwargs: Additional keyword arguments passed to the superclass.
+    :param kwargs: Additional keyword arguments passed to the superclass,
+        e.g., grouping_type.
     """
 
     def __init__(
@@ -1146,33 +1314,96 @@ class HamiltonianLayer(MeasurementLayer):
     ) -> None:
         super().__init__(
             *circuits,
-            qdevice=qdevice,
-            measurement_type=MeasurementType.Expectation,
             observables=observables,
+            qdevice=qdevice,
             **kwargs,
         )
         self.cdevice = cdevice
         self.dtype = dtype
 
         # set observable weights
-        self.num_weights = len(list(observables))
+        self.num_weights = len(self.observables)
         self.observable_weights = torch.nn.Parameter(
             torch.empty(self.num_weights, device=self.cdevice, dtype=self.dtype)
         )
         nn.init.normal_(self.observable_weights)
-        self.observable = qml.Hamiltonian(self.observable_weights, observables)
+        self.observable = self.hamiltonian()
 
-    def expectation(self, x: Optional[Tensor] = None) -> Expectation:
-        """
-        Compute the expectation of the Hamiltonian.
 
-        :param x: Input tensor, defaults to None.
-        :type x: Optional[Tensor]
-        :return: Expectation value of the Hamiltonian.
-        :rtype: Expectation
-        """
-        for circuit in self.circuits:
-            circuit(x)
-        self.observable = qml.Hamiltonian(self.observable_weights, self.observables)
-        expec = qml.expval(self.observable)
-        return expec
+class LowRankParityLayer(WeightedHamiltonianLayer):
+    """
+    A layer that computes the expectation of the Hamiltonian of all Pauli Z parities,
+    see :func:`qulearn.observable.parity_all_hamiltonian`.
+
+    The 2^n observable weights are given by the low-rank factorization
+    :func:`qulearn.observable.parity_all_lowrank_weights`. The factors are
+    trainable parameters, reducing the number of trainable weights from 2^n
+    to rank*(2^(n//2) + 2^(n - n//2)).
+
+    :param circuits: Quantum circuits that make up the circuit layer before measurement.
+    :type circuits: tuple
+    :param rank: Rank of the weight factorization, defaults to 1.
+    :type rank: int, optional
+    :param qdevice: Quantum device. If None specified, the default device is used.
+    :type qdevice: Optional[QDevice]
+    :param cdevice: Classical device to store the weight factors.
+        If None specified, the default device is used.
+    :type cdevice: CDevice, optional
+    :param dtype: Data type of the weight factors.
+    :type dtype: DType, optional
+    :param kwargs: Additional keyword arguments passed to the superclass,
+        e.g., grouping_type.
+    """
+
+    def __init__(
+        self,
+        *circuits,
+        rank: int = 1,
+        qdevice: Optional[QDevice] = None,
+        cdevice=None,
+        dtype=None,
+        **kwargs,
+    ) -> None:
+        num_qubits = circuits[0].num_wires
+        super().__init__(
+            *circuits,
+            observables=parities_all_observables(num_qubits),
+            qdevice=qdevice,
+            **kwargs,
+        )
+        self.num_qubits = num_qubits
+        self.rank = rank
+        self.cdevice = cdevice
+        self.dtype = dtype
+
+        # set weight factors, scaled such that the weights have unit variance
+        n1 = self.num_qubits // 2
+        n2 = self.num_qubits - n1
+        self.U = torch.nn.Parameter(
+            torch.empty((self.rank, 2**n1), device=self.cdevice, dtype=self.dtype)
+        )
+        self.V = torch.nn.Parameter(
+            torch.empty((self.rank, 2**n2), device=self.cdevice, dtype=self.dtype)
+        )
+        nn.init.normal_(self.U, std=self.rank**-0.25)
+        nn.init.normal_(self.V, std=self.rank**-0.25)
+
+        # index of the weights in observable order, built once
+        self.register_buffer(
+            "weight_index",
+            parity_all_lowrank_index(self.num_qubits).to(self.cdevice),
+        )
+        self.observable = self.hamiltonian()
+
+    @property
+    def observable_weights(self) -> Tensor:
+        """Observable weights computed from the factors U and V."""
+        return parity_all_lowrank_weights(
+            self.num_qubits, self.U, self.V, index=self.weight_index
+        )
+
+
+def _active_return() -> bool:
+    # qml.active_return is not available in all PennyLane versions
+    active_return = getattr(qml, "active_return", None)
+    return active_return is None or active_return()
@@ -1,4 +1,4 @@
-from typing import Optional, Callable, Dict
+from typing import Optional, Callable, Dict, List, Tuple
 
 # for python < 3.10
 try:
@@ -26,6 +26,8 @@ Model: TypeAlias = qml.QNode
 Loader: TypeAlias = DataLoader
 Tensor: TypeAlias = torch.Tensor
 Parameter: TypeAlias = nn.Parameter
+StopFn: TypeAlias = Callable[[Model], bool]
+ScalarLog: TypeAlias = Tuple[float, Dict[str, float], int]
 
 
 class EpochType(Enum):
@@ -57,6 +59,10 @@ class SupervisedTrainer:
     :type writer: Optional[Writer]
     :param logger: An optional logger for logging purposes. Default is None.
     :type logger: Optional[Logger]
+    :param log_every: Write to the writer every log_every epochs and
+        on the last (possibly early stopped) epoch. Default is 10.
+    :type log_every: int
+    :raises ValueError: If log_every is not positive.
     """
 
     def __init__(
@@ -67,15 +73,28 @@ class SupervisedTrainer:
         metrics: Dict[str, Metric] = {},
         writer: Optional[Writer] = None,
         logger: Optional[Logger] = None,
+        log_every: int = 10,
     ) -> None:
+        if log_every < 1:
+            raise ValueError(f"log_every ({log_every}) must be positive")
+
         self.optimizer = optimizer
         self.loss_fn = loss_fn
         self.metrics = metrics
         self.num_epochs = num_epochs
         self.writer = writer
         self.logger = logger
+        self.log_every = log_every
+        self._pending_scalars: Dict[str, ScalarLog] = {}
 
-    def train(self, model: Model, train_data: Loader, valid_data: Loader) -> None:
+    def train(
+        self,
+        model: Model,
+        train_data: Loader,
+        valid_data: Loader,
+        stop_fn: Optional[StopFn] = None,
+        stop_every: int = 10,
+    ) -> None:
         """
         Train the given model using the provided data loaders.
 
@@ -85,12 +104,27 @@ class SupervisedTrainer:
         :type train_data: Loader
         :param valid_data: The DataLoader for the validation data.
         :type valid_data: Loader
+        :param stop_fn: Optional criterion evaluated on the model every stop_every
+            epochs. Training stops early once it returns True. Defaults to None.
+        :type stop_fn: Optional[StopFn]
+        :param stop_every: Number of epochs between evaluations of stop_fn.
+            Defaults to 10.
+        :type stop_every: int
+        :raises ValueError: If stop_every is not positive.
         """
 
+        if stop_every < 1:
+            raise ValueError(f"stop_every ({stop_every}) must be positive")
+
         for epoch in range(1, self.num_epochs + 1):
             self.train_epoch(model, train_data, epoch)
             self.validate_epoch(model, valid_data, epoch)
 
+            if stop_fn is not None and epoch % stop_every == 0 and stop_fn(model):
+                break
+
+        self._flush_scalars()
+
     def train_epoch(self, model: Model, train_data: Loader, epoch: int = 0) -> None:
         """
         Train the model for one epoch.
@@ -122,10 +156,10 @@ class SupervisedTrainer:
     def _epoch(
         self, epoch_type: EpochType, model: Model, data: Loader, epoch: int = 0
     ) -> None:
-        running_loss = 0.0
-        running_metrics = {}
+        batch_losses = []
+        batch_metrics: Dict[str, List[Tensor]] = {}
         for metric in self.metrics:
-            running_metrics[metric] = 0.0
+            batch_metrics[metric] = []
 
         if epoch_type == EpochType.Train:
             for inputs, labels in data:
@@ -135,13 +169,17 @@ class SupervisedTrainer:
             with torch.no_grad():
                 predicted = model(inputs)
                 loss = self.loss_fn(predicted, labels)
-                running_loss += loss.item() * len(inputs)
+                # keep on device, synchronize once per epoch
+                batch_losses.append(loss * len(inputs))
                 for metric in self.metrics:
                     metric_val = self.metrics[metric](predicted, labels)
-                    running_metrics[metric] += metric_val.item() * len(inputs)
+                    batch_metrics[metric].append(metric_val * len(inputs))
 
+        running_loss = torch.stack(batch_losses).sum().item()
         running_loss /= float(len(data.dataset))  # type: ignore
+        running_metrics = {}
         for metric in self.metrics:
+            running_metrics[metric] = torch.stack(batch_metrics[metric]).sum().item()
             running_metrics[metric] /= float(len(data.dataset))  # type: ignore
 
         phase = epoch_type.name
@@ -158,11 +196,12 @@ class SupervisedTrainer:
         self, phase: str, loss: float, metrics: Dict[str, float], epoch: int
     ) -> None:
         if self.writer is not None:
-            self.writer.add_scalar(f"Loss/{phase}", loss, epoch)
-            for metric_name, metric_value in metrics.items():
-                self.writer.add_scalar(
-                    f"Metrics/{phase}/{metric_name}", metric_value, epoch
-                )
+            if epoch % self.log_every == 0 or epoch == self.num_epochs:
+                self._write_scalars(phase, loss, metrics, epoch)
+                self._pending_scalars.pop(phase, None)
+            else:
+                # written on a later cadence epoch or when training ends
+                self._pending_scalars[phase] = (loss, metrics, epoch)
 
         if self.logger is not None:
             metrics_strs = [
@@ -173,6 +212,21 @@ class SupervisedTrainer:
                 f"{phase} - Epoch: {epoch}, Loss: {loss:.6f}, Metrics: {', '.join(metrics_strs)}"
             )
 
+    def _write_scalars(
+        self, phase: str, loss: float, metrics: Dict[str, float], epoch: int
+    ) -> None:
+        if self.writer is not None:
+            self.writer.add_scalar(f"Loss/{phase}", loss, epoch)
+            for metric_name, metric_value in metrics.items():
+                self.writer.add_scalar(
+                    f"Metrics/{phase}/{metric_name}", metric_value, epoch
+                )
+
+    def _flush_scalars(self) -> None:
+        for phase, (loss, metrics, epoch) in self._pending_scalars.items():
+            self._write_scalars(phase, loss, metrics, epoch)
+        self._pending_scalars.clear()
+
 
 class RidgeRegression:
     """
@@ -68,8 +68,9 @@ def all_bin_sequences(n: int) -> List[Tuple[int, ...]]:
     :param n: The length of the binary sequences.
     :type n: int
     :return: A list of all binary sequences of length n,
-        represented as a list of integers.
-    :rtype: List[List[int]]
+        represented by the tuple of indices of the ones,
+        ordered by the number of ones.
+    :rtype: List[Tuple[int, ...]]
     """
 
     elements = list(range(n))
@@ -12,6 +12,7 @@ from qulearn.datagen import (
     NormalPrior,
     generate_lhs_samples,
     generate_model_lhs_samples,
+    gen_synthetic_labels_fat,
 )
 
 
@@ -125,10 +126,27 @@ def test_gen_dataset_data_gen_fat(setup_datagen_fat):
 
     assert isinstance(X, torch.Tensor)
     assert isinstance(Y, torch.Tensor)
-    assert isinstance(b, np.ndarray)
-    assert isinstance(r, np.ndarray)
+    assert isinstance(b, torch.Tensor)
+    assert isinstance(r, torch.Tensor)
+    assert b.dtype == torch.bool
     assert X.shape == (d, sizex)
     assert Y.shape == (Sr, Sb, d, 1)
+    assert b.shape == (Sb, d)
+    assert r.shape == (Sr, d)
+
+
+def test_gen_synthetic_labels_fat():
+    b = np.array([[0, 1], [1, 1], [0, 0]])
+    r = np.array([[0.2, 0.5], [0.7, 0.1]])
+    gamma = 0.1
+    Y = gen_synthetic_labels_fat(b, r, gamma)
+
+    assert Y.shape == (2, 3, 2, 1)
+    for sr in range(2):
+        for sb in range(3):
+            for i in range(2):
+                sign = 1.0 if b[sb, i] == 1 else -1.0
+                assert Y[sr, sb, i, 0].item() == pytest.approx(r[sr, i] + sign * gamma)
 
 
 def test_data_to_loader_raises_value_error_for_invalid_sr_data_gen_fat(
@@ -1,10 +1,17 @@
 import os
 import tempfile
+import pytest
 import torch
 from torch.nn import Linear
 from torch.optim import Adam
 
-from qulearn.fat import fat_shattering_dim, check_shattering, normalize_const
+from qulearn.fat import (
+    fat_shattering_dim,
+    check_shattering,
+    check_margins,
+    normalize_const,
+    _check_shattering_dims,
+)
 from qulearn.datagen import DataGenFat, UniformPrior
 from qulearn.trainer import SupervisedTrainer
 
@@ -16,6 +23,7 @@ def test_normalize_const():
     C = normalize_const(weights, gamma, sizex)
     assert isinstance(C, float)
     assert C > 0.0
+    assert C == pytest.approx(14.0 * sizex**2 / gamma**2)
 
 
 def test_check_shattering():
@@ -61,6 +69,46 @@ def test_fat_shattering_dim():
     assert fat_shattering_dimension > 0
 
 
+def _linear_setup(sizex, Sb, Sr, gamma):
+    torch.manual_seed(0)
+    prior = UniformPrior(sizex, seed=0)
+    datagen = DataGenFat(prior, Sb, Sr, 2.0 * gamma, seed=0)
+    model = Linear(sizex, 1, dtype=torch.float64)
+    opt = Adam(model.parameters(), lr=0.1)
+    trainer = SupervisedTrainer(opt, loss_fn=torch.nn.MSELoss(), num_epochs=300)
+    return model, datagen, trainer
+
+
+def test_fat_shattering_dim_parallel():
+    # all 2^d labelings are checked, affine functions on R^2 have pseudo-dim 3
+    sizex = 2
+    dmin = 1
+    dmax = 5
+    Sb = 32
+    Sr = 5
+    gamma = 0.1
+
+    model, datagen, trainer = _linear_setup(sizex, Sb, Sr, gamma)
+    expected = fat_shattering_dim(model, datagen, trainer, dmin, dmax, gamma)
+
+    model, datagen, trainer = _linear_setup(sizex, Sb, Sr, gamma)
+    fat_shattering_dimension = fat_shattering_dim(
+        model, datagen, trainer, dmin, dmax, gamma, max_workers=2
+    )
+    assert fat_shattering_dimension == expected
+
+
+def test_check_shattering_dims_close():
+    model, datagen, trainer = _linear_setup(2, 32, 5, 0.1)
+    results = _check_shattering_dims(
+        model, datagen, trainer, range(1, 9), 0.1, max_workers=2
+    )
+    assert next(results)
+    results.close()
+    with pytest.raises(StopIteration):
+        next(results)
+
+
 def test_linear_model():
     sizex = 3
     dmin = 2
@@ -85,3 +133,18 @@ def test_linear_model():
 
     assert isinstance(fat_shattering_dimension, int)
     assert fat_shattering_dimension >= sizex
+
+
+def test_check_margins():
+    model = Linear(1, 1, dtype=torch.float64)
+    torch.nn.init.ones_(model.weight)
+    torch.nn.init.zeros_(model.bias)
+    X = torch.tensor([[0.0], [1.0]], dtype=torch.float64)
+    r = torch.tensor([0.5, 0.5], dtype=torch.float64)
+    gamma = 0.1
+
+    b = torch.tensor([0, 1])
+    assert check_margins(model, X, b, r, gamma)
+
+    b = torch.tensor([1, 1])
+    assert not check_margins(model, X, b, r, gamma)
@@ -5,6 +5,8 @@ import pennylane as qml
 from qulearn.observable import (
     parity_all_hamiltonian,
     parities_all_observables,
+    parity_all_lowrank_index,
+    parity_all_lowrank_weights,
     sequence2parity_observable,
 )
 
@@ -68,3 +70,53 @@ def test_sequence2parity_observable():
     assert len(observables) == 4
     assert observables[0].name == ["PauliZ", "PauliZ"]
     assert observables[3].name == "Identity"
+
+
+def test_parities_all_observables_cached():
+    n = 3
+    observables = parities_all_observables(n)
+    observables.pop()
+    assert len(parities_all_observables(n)) == 8
+    assert parities_all_observables(n)[0] is observables[0]
+
+
+def test_sequence2parity_observable_matches_product():
+    sequence = [(0,), (0, 2), (0, 1, 2)]
+    observables = sequence2parity_observable(sequence)
+    expected = [
+        qml.PauliZ(0),
+        qml.PauliZ(0) @ qml.PauliZ(2),
+        qml.PauliZ(0) @ qml.PauliZ(1) @ qml.PauliZ(2),
+        qml.Identity(0),
+    ]
+    for obs, exp in zip(observables, expected):
+        assert qml.equal(obs, exp)
+
+
+def test_parity_all_lowrank_weights():
+    U = torch.tensor([[2.0, 3.0]])
+    V = torch.tensor([[5.0, 7.0]])
+    W = parity_all_lowrank_weights(2, U, V)
+    # order: Z0, Z1, Z0 Z1, I
+    assert torch.equal(W, torch.tensor([15.0, 14.0, 21.0, 10.0]))
+
+    num_qubits = 5
+    U = torch.randn(3, 4)
+    V = torch.randn(3, 8)
+    W = parity_all_lowrank_weights(num_qubits, U, V)
+    assert W.shape == (2**num_qubits,)
+    assert torch.allclose(W.sort().values, torch.matmul(U.T, V).flatten().sort().values)
+    H = parity_all_hamiltonian(num_qubits, W)
+    assert len(H.ops) == 2**num_qubits
+
+    index = parity_all_lowrank_index(num_qubits)
+    assert index.dtype == torch.long
+    assert torch.equal(W, parity_all_lowrank_weights(num_qubits, U, V, index=index))
+
+
+def test_parity_all_lowrank_weights_invalid_shapes():
+    with pytest.raises(ValueError):
+        parity_all_lowrank_weights(3, torch.randn(2, 2), torch.randn(2, 2))
+
+    with pytest.raises(ValueError):
+        parity_all_lowrank_weights(3, torch.randn(2, 2), torch.randn(3, 4))
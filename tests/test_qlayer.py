@@ -14,6 +14,7 @@ from qulearn.qlayer import (
     IQPERYCZLayer,
     IQPEAltRotCXLayer,
     HamiltonianLayer,
+    LowRankParityLayer,
     HadamardLayer,
     ParallelIQPEncoding,
     ParallelEntangledIQPEncoding,
@@ -110,6 +111,15 @@ def test_measurement_layer_set_qnode(mock_measurement_layer):
     assert qnode is not None
 
 
+def test_measurement_layer_forward_reuses_qnode(mock_measurement_layer):
+    layer = mock_measurement_layer
+    qnode = layer.qnode
+    x = torch.tensor([0.1, 0.2])
+    layer(x)
+    layer(x)
+    assert layer.qnode is qnode
+
+
 def test_measurement_layer_check_measurement_type(mock_measurement_layer):
     layer = mock_measurement_layer
     layer.measurement_type = "invalid"
@@ -117,6 +127,28 @@ def test_measurement_layer_check_measurement_type(mock_measurement_layer):
         layer.check_measurement_type()
 
 
+def test_measurement_layer_default_diff_method():
+    wires = 2
+    circuit = CircuitLayer(wires)
+    layer = MeasurementLayer(circuit)
+    assert layer.diff_method == "backprop"
+
+    qdevice = qml.device("lightning.qubit", wires=wires)
+    layer = MeasurementLayer(
+        circuit,
+        qdevice=qdevice,
+        measurement_type=MeasurementType.Expectation,
+        observables=qml.PauliZ(0),
+    )
+    assert layer.diff_method == "adjoint"
+
+    layer = MeasurementLayer(circuit, qdevice=qdevice)
+    assert layer.diff_method == "parameter-shift"
+
+    layer = HamiltonianLayer(circuit, observables=[qml.PauliZ(0)], qdevice=qdevice)
+    assert layer.diff_method == "parameter-shift"
+
+
 # Unit tests for IQPEmbeddingLayer class
 
 
@@ -247,6 +279,73 @@ def test_hamiltonian_layer_forward():
     assert layer.forward(x) is not None
 
 
+def test_hamiltonian_layer_grouping():
+    wires = 2
+    observables = [qml.PauliZ(0), qml.PauliZ(1), qml.PauliZ(0) @ qml.PauliZ(1)]
+    circuit = IQPERYCZLayer(wires)
+    layer = HamiltonianLayer(circuit, observables=observables, grouping_type="qwc")
+    assert len(layer.grouping_indices) == 1
+
+    x = torch.tensor([0.1, 0.2])
+    output = layer(x)
+    assert layer.observable.grouping_indices == layer.grouping_indices
+
+    layer.grouping_indices = None
+    assert torch.allclose(output, layer(x))
+
+
+def test_lowrank_parity_layer():
+    wires = 3
+    rank = 2
+    circuit = IQPERYCZLayer(wires)
+    layer = LowRankParityLayer(circuit, rank=rank)
+    assert layer.U.shape == (rank, 2)
+    assert layer.V.shape == (rank, 4)
+    assert layer.observable_weights.shape == (2**wires,)
+    assert len(layer.observables) == 2**wires
+    assert isinstance(layer.observable, qml.Hamiltonian)
+
+    x = torch.randn((5, wires))
+    output = layer(x)
+    assert output.shape == torch.Size([5, 1])
+
+    output.sum().backward()
+    assert layer.U.grad is not None
+    assert layer.V.grad is not None
+
+    assert "weight_index" in dict(layer.named_buffers())
+    assert layer.weight_index.shape == (2**wires,)
+
+
+def test_lowrank_parity_layer_grouping():
+    wires = 2
+    circuit = IQPERYCZLayer(wires)
+    layer = LowRankParityLayer(circuit, grouping_type="qwc")
+    assert len(layer.grouping_indices) == 1
+
+    x = torch.tensor([0.1, 0.2])
+    output = layer(x)
+    assert layer.observable.grouping_indices == layer.grouping_indices
+
+    layer.grouping_indices = None
+    assert torch.allclose(output, layer(x))
+
+
+@pytest.mark.parametrize("grouping_type", [None, "qwc"])
+def test_lowrank_parity_layer_batched(grouping_type):
+    wires = 3
+    num_samples = 4
+    circuit = IQPERYCZLayer(wires=wires, num_repeat=2)
+    layer = LowRankParityLayer(circuit, rank=2, grouping_type=grouping_type)
+    x = torch.randn((num_samples, wires))
+    expected = layer(x)
+
+    layer.batched = True
+    output = layer(x)
+    assert output.shape == torch.Size([num_samples, 1])
+    assert torch.allclose(output, expected)
+
+
 # Integration tests
 
 
@@ -436,6 +535,48 @@ def test_forward_shape_1D_obs_hamiltonian():
     assert output.shape == torch.Size([num_samples, 1])
 
 
+@pytest.mark.parametrize("grouping_type", [None, "qwc"])
+def test_forward_batched_hamiltonian(grouping_type):
+    num_features = 2
+    num_samples = 4
+    circuit = IQPERYCZLayer(wires=num_features, num_repeat=2)
+    observables = [qml.Identity(0), qml.PauliZ(0), qml.PauliZ(0) @ qml.PauliZ(1)]
+    model = HamiltonianLayer(
+        circuit, observables=observables, grouping_type=grouping_type
+    )
+    assert model.supports_broadcasting() == (grouping_type is not None)
+    x = torch.randn((num_samples, num_features))
+    expected = model(x)
+
+    model.batched = True
+    output = model(x)
+    assert output.shape == torch.Size([num_samples, 1])
+    assert torch.allclose(output, expected)
+
+
+@pytest.mark.parametrize(
+    "measurement_type, out_dim",
+    [(MeasurementType.Expectation, 3), (MeasurementType.Probabilities, 8)],
+)
+def test_forward_batched_measurement_layer(measurement_type, out_dim):
+    num_features = 3
+    num_samples = 4
+    circuit = IQPERYCZLayer(wires=num_features, num_repeat=2)
+    model = MeasurementLayer(
+        circuit,
+        observables=[qml.PauliZ(i) for i in range(num_features)],
+        measurement_type=measurement_type,
+    )
+    assert model.supports_broadcasting()
+    x = torch.randn((num_samples, num_features))
+    expected = model(x)
+
+    model.batched = True
+    output = model(x)
+    assert output.shape == torch.Size([num_samples, out_dim])
+    assert torch.allclose(output, expected)
+
+
 @pytest.fixture
 def sample_hat_basis():
     return HatBasis(a=0, b=1, num_nodes=4)
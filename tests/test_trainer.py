@@ -50,6 +50,69 @@ def test_trainer():
         assert 0.0 == pytest.approx(final_loss, abs=1e-3)
 
 
+def test_trainer_stop_fn():
+    X = torch.randn(8, 2, dtype=torch.float64)
+    Y = torch.randn(8, 1, dtype=torch.float64)
+    loader = DataLoader(TensorDataset(X, Y), batch_size=8)
+    model = torch.nn.Linear(2, 1, dtype=torch.float64)
+    opt = Adam(model.parameters(), lr=0.1)
+    trainer = SupervisedTrainer(opt, torch.nn.MSELoss(), num_epochs=10)
+
+    calls = []
+
+    def stop_fn(_):
+        calls.append(1)
+        return len(calls) == 3
+
+    trainer.train(model, loader, loader, stop_fn=stop_fn, stop_every=1)
+    assert len(calls) == 3
+
+    calls.clear()
+    trainer.train(
+        model, loader, loader, stop_fn=lambda _: calls.append(1), stop_every=4
+    )
+    assert len(calls) == 2
+
+    with pytest.raises(ValueError):
+        trainer.train(model, loader, loader, stop_fn=stop_fn, stop_every=0)
+
+
+def test_trainer_log_every():
+    X = torch.randn(8, 2, dtype=torch.float64)
+    Y = torch.randn(8, 1, dtype=torch.float64)
+    loader = DataLoader(TensorDataset(X, Y), batch_size=8)
+    model = torch.nn.Linear(2, 1, dtype=torch.float64)
+    opt = Adam(model.parameters(), lr=0.1)
+
+    class MockWriter:
+        def __init__(self):
+            self.epochs = []
+
+        def add_scalar(self, tag, value, epoch):
+            if tag == "Loss/Validate":
+                self.epochs.append(epoch)
+
+    writer = MockWriter()
+    trainer = SupervisedTrainer(
+        opt, torch.nn.MSELoss(), num_epochs=25, writer=writer, log_every=10
+    )
+    trainer.train(model, loader, loader)
+    assert writer.epochs == [10, 20, 25]
+
+    writer.epochs.clear()
+    calls = []
+
+    def stop_fn(_):
+        calls.append(1)
+        return len(calls) == 3
+
+    trainer.train(model, loader, loader, stop_fn=stop_fn, stop_every=5)
+    assert writer.epochs == [10, 15]
+
+    with pytest.raises(ValueError):
+        SupervisedTrainer(opt, torch.nn.MSELoss(), num_epochs=25, log_every=0)
+
+
 @pytest.fixture
 def setup_ridge_regression():
     lambda_reg = 0.1
@@ -29,6 +29,20 @@ def test_all_bin_sequences():
     )
 
 
+def test_all_bin_sequences_order():
+    # order defines which parity observable each Hamiltonian weight belongs to
+    assert all_bin_sequences(3) == [
+        (),
+        (0,),
+        (1,),
+        (2,),
+        (0, 1),
+        (0, 2),
+        (1, 2),
+        (0, 1, 2),
+    ]
+
+
 # parities_outcome
 def test_parities_outcome():
     bitstring = "01"